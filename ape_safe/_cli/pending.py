@@ -1,3 +1,4 @@
+from collections import defaultdict
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Optional, Union, cast
 
@@ -47,12 +48,9 @@ def _list(cli_ctx, safe, verbose) -> None:
         rich.print("There are no pending transactions.")
         return
 
-    txns_by_nonce: dict[int, list[UnexecutedTxData]] = {}
+    txns_by_nonce: defaultdict[int, list[UnexecutedTxData]] = defaultdict(list)
     for txn in txns:
-        if txn.nonce in txns_by_nonce:
-            txns_by_nonce[txn.nonce].append(txn)
-        else:
-            txns_by_nonce[txn.nonce] = [txn]
+        txns_by_nonce[txn.nonce].append(txn)
 
     all_items = txns_by_nonce.items()
     total_items = len(all_items)
@@ -277,6 +275,7 @@ def _execute(safe: "SafeAccount", txn: "UnexecutedTxData", submitter: "AccountAP
     }
     exc_tx = safe.create_execute_transaction(safe_tx, signatures, **tx_kwargs)
     submitter.call(exc_tx)
+    safe.client.invalidate_safe_details()
 
 
 @pending.command(cls=ConnectedProviderCommand)
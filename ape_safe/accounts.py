@@ -33,7 +33,7 @@ from ape_safe.exceptions import (
     SafeClientException,
     handle_safe_logic_error,
 )
-from ape_safe.utils import get_safe_tx_hash, order_by_signer
+from ape_safe.utils import FALLBACK_HANDLER_STORAGE_SLOT, get_safe_tx_hash, order_by_signer
 
 if TYPE_CHECKING:
     from ape.api.address import BaseAddress
@@ -239,8 +239,7 @@ class SafeAccount(AccountAPI):
 
     @cached_property
     def fallback_handler(self) -> Optional["ContractInstance"]:
-        slot = keccak(text="fallback_manager.handler.address")
-        value = self.provider.get_storage(self.address, slot)
+        value = self.provider.get_storage(self.address, FALLBACK_HANDLER_STORAGE_SLOT)
         address = self.network_manager.ecosystem.decode_address(value[-20:])
         return (
             self.chain_manager.contracts.instance_at(address) if address != ZERO_ADDRESS else None
@@ -531,9 +530,17 @@ class SafeAccount(AccountAPI):
         )
         call_kwargs["submit"] = submit
         if impersonate:
-            return self._impersonated_call(txn, **call_kwargs)
+            receipt = self._impersonated_call(txn, **call_kwargs)
 
-        return super().call(txn, **call_kwargs)
+        else:
+            receipt = super().call(txn, **call_kwargs)
+
+        # NOTE: Executing may change the owners or threshold, so don't use stale details.
+        #       Only if a client was already created, e.g. there is none on unsupported chains.
+        if "client" in self.__dict__:
+            self.client.invalidate_safe_details()
+
+        return receipt
 
     def get_api_confirmations(self, safe_tx: SafeTx) -> dict[AddressType, MessageSignature]:
         safe_tx_id = get_safe_tx_hash(safe_tx)
@@ -590,7 +597,12 @@ class SafeAccount(AccountAPI):
         if not isinstance(submitter, AccountAPI):
             submitter = self.load_submitter(submitter)
 
-        return submitter.call(txn)
+        receipt = submitter.call(txn)
+        # NOTE: Executing may change the owners or threshold, so don't use stale details.
+        if "client" in self.__dict__:
+            self.client.invalidate_safe_details()
+
+        return receipt
 
     def sign_transaction(
         self,
@@ -1,13 +1,16 @@
 import json
+import time
 from collections.abc import Iterator
-from datetime import datetime
-from functools import reduce
-from typing import Optional, Union, cast
+from functools import cache
+from types import MappingProxyType
+from typing import Annotated, Any, Optional, Union
 
 from ape.types import AddressType, HexBytes, MessageSignature
 from ape.utils import USER_AGENT, get_package_version
 from eip712.common import SafeTxV1, SafeTxV2
-from eth_utils import to_hex
+from pydantic import Discriminator, Tag, TypeAdapter
+from pydantic_core import from_json
+from typing_extensions import Required, TypedDict
 
 from ape_safe.client.base import BaseSafeClient
 from ape_safe.client.mock import MockSafeClient
@@ -27,33 +30,111 @@ from ape_safe.exceptions import (
     ClientUnsupportedChainError,
     MultisigTransactionNotFoundError,
 )
-from ape_safe.utils import get_safe_tx_hash, order_by_signer
-
-APE_SAFE_VERSION = get_package_version(__name__)
-APE_SAFE_USER_AGENT = f"Ape-Safe/{APE_SAFE_VERSION} {USER_AGENT}"
-# NOTE: Origin must be a string, but can be json that contains url & name fields
-ORIGIN = json.dumps(dict(url="https://apeworx.io", name="Ape Safe", ua=APE_SAFE_USER_AGENT))
-assert len(ORIGIN) <= 200  # NOTE: Must be less than 200 chars
-
-TRANSACTION_SERVICE_URL = {
-    # NOTE: If URLs need to be updated, a list of available service URLs can be found at
-    # https://docs.safe.global/safe-core-api/available-services.
-    # NOTE: There should be no trailing slashes at the end of the URL.
-    1: "https://safe-transaction-mainnet.safe.global",
-    10: "https://safe-transaction-optimism.safe.global",
-    56: "https://safe-transaction-bsc.safe.global",
-    100: "https://safe-transaction-gnosis-chain.safe.global",
-    137: "https://safe-transaction-polygon.safe.global",
-    250: "https://safe-txservice.fantom.network",
-    288: "https://safe-transaction.mainnet.boba.network",
-    8453: "https://safe-transaction-base.safe.global",
-    42161: "https://safe-transaction-arbitrum.safe.global",
-    43114: "https://safe-transaction-avalanche.safe.global",
-    84531: "https://safe-transaction-base-testnet.safe.global",
-    11155111: "https://safe-transaction-sepolia.safe.global",
-    81457: "https://transaction.blast-safe.io",
+from ape_safe.utils import get_safe_tx_hash, order_by_signer, to_safe_tx_id
+
+TRANSACTION_SERVICE_URL = MappingProxyType(
+    {
+        # NOTE: If URLs need to be updated, a list of available service URLs can be found at
+        # https://docs.safe.global/safe-core-api/available-services.
+        # NOTE: There should be no trailing slashes at the end of the URL.
+        1: "https://safe-transaction-mainnet.safe.global",
+        10: "https://safe-transaction-optimism.safe.global",
+        56: "https://safe-transaction-bsc.safe.global",
+        100: "https://safe-transaction-gnosis-chain.safe.global",
+        137: "https://safe-transaction-polygon.safe.global",
+        250: "https://safe-txservice.fantom.network",
+        288: "https://safe-transaction.mainnet.boba.network",
+        8453: "https://safe-transaction-base.safe.global",
+        42161: "https://safe-transaction-arbitrum.safe.global",
+        43114: "https://safe-transaction-avalanche.safe.global",
+        84531: "https://safe-transaction-base-testnet.safe.global",
+        11155111: "https://safe-transaction-sepolia.safe.global",
+        81457: "https://transaction.blast-safe.io",
+    }
+)
+
+
+@cache
+def get_ape_safe_version() -> str:
+    return get_package_version(__name__)
+
+
+@cache
+def get_user_agent() -> str:
+    return f"Ape-Safe/{get_ape_safe_version()} {USER_AGENT}"
+
+
+@cache
+def get_origin() -> str:
+    # NOTE: Origin must be a string, but can be json that contains url & name fields
+    origin = json.dumps(dict(url="https://apeworx.io", name="Ape Safe", ua=get_user_agent()))
+    assert len(origin) <= 200  # NOTE: Must be less than 200 chars
+    return origin
+
+
+def _get_tx_tag(txn: Any) -> str:
+    if "isExecuted" not in txn:
+        return "incoming"
+
+    return "executed" if txn["isExecuted"] else "unexecuted"
+
+
+class _Page(TypedDict, total=False):
+    count: int
+    next: Optional[str]
+
+
+class _ConfirmationsPage(_Page):
+    results: Required[list[SafeTxConfirmation]]
+
+
+class _TransactionsPage(_Page):
+    # NOTE: Results without `isExecuted` are incoming transactions, which are left as-is.
+    results: Required[
+        list[
+            Annotated[
+                Union[
+                    Annotated[ExecutedTxData, Tag("executed")],
+                    Annotated[UnexecutedTxData, Tag("unexecuted")],
+                    Annotated[dict, Tag("incoming")],
+                ],
+                Discriminator(_get_tx_tag),
+            ]
+        ]
+    ]
+
+
+# NOTE: Validate whole pages straight from the raw response, instead of one model at a time.
+#       The adapters are built on first use, to keep importing the client fast.
+@cache
+def _get_confirmations_page_adapter() -> TypeAdapter[_ConfirmationsPage]:
+    return TypeAdapter(_ConfirmationsPage)
+
+
+@cache
+def _get_transactions_page_adapter() -> TypeAdapter[_TransactionsPage]:
+    return TypeAdapter(_TransactionsPage)
+
+
+# NOTE: The transaction fields sent when proposing a transaction. The signature, hash
+#       and sender are added separately.
+_POST_TX_FIELDS = {
+    "safe",
+    "to",
+    "value",
+    "data",
+    "operation",
+    "gas_token",
+    "safe_tx_gas",
+    "base_gas",
+    "gas_price",
+    "refund_receiver",
+    "nonce",
 }
 
+# NOTE: How long (in seconds) fetched Safe details are re-used before fetching again.
+SAFE_DETAILS_CACHE_TTL = 10
+
 
 class SafeClient(BaseSafeClient):
     def __init__(
@@ -63,90 +144,80 @@ class SafeClient(BaseSafeClient):
         chain_id: Optional[int] = None,
     ) -> None:
         self.address = address
+        self._safe_details_cache: Optional[tuple[float, SafeDetails]] = None
 
         if override_url:
             tx_service_url = override_url
 
         elif chain_id:
-            if chain_id not in TRANSACTION_SERVICE_URL:
-                raise ClientUnsupportedChainError(chain_id)
-
-            tx_service_url = TRANSACTION_SERVICE_URL[chain_id]
+            try:
+                tx_service_url = TRANSACTION_SERVICE_URL[chain_id]
+            except KeyError:
+                raise ClientUnsupportedChainError(chain_id) from None
 
         else:
             raise ValueError("Must provide one of chain_id or override_url.")
 
         super().__init__(tx_service_url)
+        self._safe_url = f"safes/{address}"
+        self._all_transactions_url = f"{self._safe_url}/all-transactions"
+        self._estimations_url = f"{self._safe_url}/multisig-transactions/estimations"
 
     @property
     def safe_details(self) -> SafeDetails:
-        response = self._get(f"safes/{self.address}")
-        return SafeDetails.model_validate(response.json())
+        if self._safe_details_cache is not None:
+            cached_at, safe_details = self._safe_details_cache
+            if time.monotonic() - cached_at < SAFE_DETAILS_CACHE_TTL:
+                return safe_details
+
+        response = self._get(self._safe_url)
+        safe_details = SafeDetails.model_validate_json(response.content)
+        self._safe_details_cache = (time.monotonic(), safe_details)
+        return safe_details
+
+    def invalidate_safe_details(self):
+        self._safe_details_cache = None
 
     def get_next_nonce(self) -> int:
-        return self.safe_details.nonce
+        # NOTE: The nonce changes with every execution, so it is never served from the cache.
+        #       Only the nonce is needed, skip validating the rest of the Safe details.
+        response = self._get(self._safe_url)
+        return int(from_json(response.content)["nonce"])
 
     def _all_transactions(self) -> Iterator[SafeApiTxData]:
         """
         Get all transactions from safe, both confirmed and unconfirmed
         """
 
-        url = f"safes/{self.address}/all-transactions"
-        while url:
-            response = self._get(url)
-            data = response.json()
-
-            for txn in data.get("results"):
-                # NOTE: Using construct because of pydantic v2 back import validation error.
-                if "isExecuted" in txn:
-                    if txn["isExecuted"]:
-                        yield ExecutedTxData.model_validate(txn)
-
-                    else:
-                        yield UnexecutedTxData.model_validate(txn)
-
-                # else it is an incoming transaction
-
-            url = data.get("next")
+        for data in self._paginate(
+            self._all_transactions_url, parse=_get_transactions_page_adapter().validate_json
+        ):
+            # NOTE: Skip incoming transactions.
+            yield from (txn for txn in data["results"] if isinstance(txn, UnexecutedTxData))
 
     def get_confirmations(self, safe_tx_hash: SafeTxID) -> Iterator[SafeTxConfirmation]:
-        url = f"multisig-transactions/{str(safe_tx_hash)}/confirmations"
-        while url:
-            response = self._get(url)
-            data = response.json()
-            yield from map(SafeTxConfirmation.model_validate, data.get("results"))
-            url = data.get("next")
+        for data in self._paginate(
+            f"multisig-transactions/{to_safe_tx_id(safe_tx_hash)}/confirmations",
+            parse=_get_confirmations_page_adapter().validate_json,
+        ):
+            yield from data["results"]
 
     def post_transaction(
         self, safe_tx: SafeTx, signatures: dict[AddressType, MessageSignature], **kwargs
     ):
         tx_data = UnexecutedTxData.from_safe_tx(safe_tx, self.safe_details.threshold)
-        signature = HexBytes(
-            reduce(
-                lambda raw_sig, next_sig: raw_sig
-                + (next_sig.encode_rsv() if isinstance(next_sig, MessageSignature) else next_sig),
-                order_by_signer(signatures),
-                b"",
-            )
+        signature = b"".join(
+            sig.encode_rsv() if isinstance(sig, MessageSignature) else sig
+            for sig in order_by_signer(signatures)
         )
-        post_dict: dict = {"signature": to_hex(signature), "origin": ORIGIN}
-
-        for key, value in tx_data.model_dump(by_alias=True, mode="json").items():
-            if isinstance(value, HexBytes):
-                post_dict[key] = to_hex(value)
-            elif isinstance(value, OperationType):
-                post_dict[key] = int(value)
-            elif isinstance(value, datetime):
-                # not needed
-                continue
-            else:
-                post_dict[key] = value
-
-        post_dict = {**post_dict, **kwargs}
-
-        if "signatures" in post_dict:
-            # Signature handled above.
-            post_dict.pop("signatures")
+        post_dict: dict = {
+            # NOTE: The signature is always bytes, so skip `to_hex` type dispatch.
+            "signature": f"0x{signature.hex()}",
+            "origin": get_origin(),
+            # NOTE: `mode="json"` already serializes bytes to hex and enums to ints.
+            **tx_data.model_dump(by_alias=True, mode="json", include=_POST_TX_FIELDS),
+            **kwargs,
+        }
 
         url = f"safes/{tx_data.safe}/multisig-transactions"
         response = self._post(url, json=post_dict)
@@ -157,38 +228,60 @@ class SafeClient(BaseSafeClient):
         safe_tx_or_hash: Union[SafeTx, SafeTxID],
         signatures: dict[AddressType, MessageSignature],
     ):
+        if not signatures:
+            return  # NOTE: Nothing to confirm, avoid posting an empty signature.
+
         if isinstance(safe_tx_or_hash, (SafeTxV1, SafeTxV2)):
             safe_tx = safe_tx_or_hash
             safe_tx_hash = get_safe_tx_hash(safe_tx)
         else:
             safe_tx_hash = safe_tx_or_hash
 
-        safe_tx_hash = cast(SafeTxID, to_hex(HexBytes(safe_tx_hash)))
+        safe_tx_hash = to_safe_tx_id(safe_tx_hash)
         url = f"multisig-transactions/{safe_tx_hash}/confirmations"
-        signature = to_hex(
-            HexBytes(b"".join([x.encode_rsv() for x in order_by_signer(signatures)]))
-        )
+        signature = b"".join(x.encode_rsv() for x in order_by_signer(signatures))
         try:
-            self._post(url, json={"signature": signature})
+            self._post(url, json={"signature": f"0x{signature.hex()}"})
         except ClientResponseError as err:
-            if "The requested resource was not found on this server" in err.response.text:
-                raise MultisigTransactionNotFoundError(safe_tx_hash, url, err.response) from err
+            response = err.response
+            # NOTE: Only a 404 can be a missing transaction, skip searching other error bodies.
+            if (
+                response.status_code == 404
+                and "The requested resource was not found on this server" in response.text
+            ):
+                raise MultisigTransactionNotFoundError(safe_tx_hash, url, response) from err
 
             raise  # The error from BaseClient we are already raising (no changes)
 
     def estimate_gas_cost(
         self, receiver: AddressType, value: int, data: bytes, operation: int = 0
     ) -> Optional[int]:
-        url = f"safes/{self.address}/multisig-transactions/estimations"
+        url = self._estimations_url
         request: dict = {
             "to": receiver,
             "value": value,
-            "data": to_hex(HexBytes(data)),
+            # NOTE: Transaction data is usually bytes already, so only convert other values.
+            "data": f"0x{bytes.hex(data if isinstance(data, bytes) else HexBytes(data))}",
             "operation": operation,
         }
-        result = self._post(url, json=request).json()
+        result = from_json(self._post(url, json=request).content)
         gas = result.get("safeTxGas")
-        return int(to_hex(HexBytes(gas)), 16)
+        return int.from_bytes(HexBytes(gas), "big")
+
+
+def __getattr__(name: str) -> Any:
+    # NOTE: These are computed lazily to avoid looking up the package version on import.
+    if name == "APE_SAFE_VERSION":
+        return get_ape_safe_version()
+
+    elif name == "APE_SAFE_USER_AGENT":
+        return get_user_agent()
+
+    elif name == "ORIGIN":
+        return get_origin()
+
+    else:
+        raise AttributeError(name)
 
 
 __all__ = [
@@ -1,62 +1,110 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
-from functools import cached_property
-from typing import TYPE_CHECKING, Optional, Union
+from collections import deque
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, cached_property
+from itertools import islice
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
-import certifi
 import requests
-import urllib3
+from pydantic_core import from_json, to_json
 from requests.adapters import HTTPAdapter
 
-from ape_safe.client.types import (
-    ExecutedTxData,
-    SafeApiTxData,
-    SafeDetails,
-    SafeTx,
-    SafeTxConfirmation,
-    SafeTxID,
-    UnexecutedTxData,
-)
 from ape_safe.exceptions import ClientResponseError
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from ape.types import AddressType, MessageSignature
     from requests import Response
 
+    from ape_safe.client.types import (
+        SafeApiTxData,
+        SafeDetails,
+        SafeTx,
+        SafeTxConfirmation,
+        SafeTxID,
+    )
+
 DEFAULT_HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
 }
 
+# NOTE: How many pages are requested ahead of time when paginating.
+PAGE_WINDOW = 4
+
+
+def _get_page_urls(next_url: str, count: Optional[int]) -> Optional[Iterator[str]]:
+    """
+    Get the URLs of all remaining pages of an offset-paginated endpoint,
+    starting with ``next_url``, or ``None`` if they cannot be known in advance.
+    """
+    parts = urlsplit(next_url)
+    query = parse_qs(parts.query)
+    try:
+        limit = int(query["limit"][0])
+        offset = int(query["offset"][0])
+    except (KeyError, ValueError):
+        return None
+
+    if not isinstance(count, int) or limit < 1:
+        return None
+
+    def page_url(page_offset: int) -> str:
+        query["offset"] = [str(page_offset)]
+        return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+
+    return (page_url(page_offset) for page_offset in range(offset, count, limit))
+
+
+@cache
+def _get_executor() -> ThreadPoolExecutor:
+    # NOTE: Shared by all clients, only used to fetch pages ahead of time.
+    return ThreadPoolExecutor(max_workers=PAGE_WINDOW, thread_name_prefix="ape-safe")
+
 
 class BaseSafeClient(ABC):
+    """
+    Base class for Safe API clients.
+
+    HTTP connections to the transaction service are pooled and shared by all clients using
+    the same service.
+    """
+
+    # NOTE: Sessions are shared by every client using the same transaction service,
+    #       so keep-alive connections are re-used across clients.
+    _sessions: ClassVar[dict[str, requests.Session]] = {}
+
     def __init__(self, transaction_service_url: str):
         self.transaction_service_url = transaction_service_url
+        self._api_url = f"{transaction_service_url}/api/v1/"
 
     """Abstract methods"""
 
     @property
     @abstractmethod
-    def safe_details(self) -> SafeDetails: ...
+    def safe_details(self) -> "SafeDetails": ...
 
     @abstractmethod
     def get_next_nonce(self) -> int: ...
 
     @abstractmethod
-    def _all_transactions(self) -> Iterator[SafeApiTxData]: ...
+    def _all_transactions(self) -> Iterator["SafeApiTxData"]: ...
 
     @abstractmethod
-    def get_confirmations(self, safe_tx_hash: SafeTxID) -> Iterator[SafeTxConfirmation]: ...
+    def get_confirmations(self, safe_tx_hash: "SafeTxID") -> Iterator["SafeTxConfirmation"]: ...
 
     @abstractmethod
     def post_transaction(
-        self, safe_tx: SafeTx, signatures: dict["AddressType", "MessageSignature"], **kwargs
+        self, safe_tx: "SafeTx", signatures: dict["AddressType", "MessageSignature"], **kwargs
     ): ...
 
     @abstractmethod
     def post_signatures(
         self,
-        safe_tx_or_hash: Union[SafeTx, SafeTxID],
+        safe_tx_or_hash: Union["SafeTx", "SafeTxID"],
         signatures: dict["AddressType", "MessageSignature"],
     ): ...
 
@@ -67,94 +115,192 @@ class BaseSafeClient(ABC):
 
     """Shared methods"""
 
+    def invalidate_safe_details(self):
+        """
+        Forget any cached Safe details, e.g. after executing a transaction changed the owners.
+        """
+
     def get_transactions(
         self,
         confirmed: Optional[bool] = None,
         starting_nonce: int = 0,
         ending_nonce: Optional[int] = None,
-        filter_by_ids: Optional[set[SafeTxID]] = None,
+        filter_by_ids: Optional[set["SafeTxID"]] = None,
         filter_by_missing_signers: Optional[set["AddressType"]] = None,
-    ) -> Iterator[SafeApiTxData]:
+    ) -> Iterator["SafeApiTxData"]:
         """
         confirmed: Confirmed if True, not confirmed if False, both if None
         """
         next_nonce = self.get_next_nonce()
+        # NOTE: Convert once, instead of on every transaction.
+        missing_signers = frozenset(filter_by_missing_signers or ())
 
-        # NOTE: We loop backwards.
-        for txn in self._all_transactions():
-            if ending_nonce is not None and txn.nonce > ending_nonce:
-                # NOTE: Skip all largest nonces first
-                continue
+        txns = self._all_transactions()
+        try:
+            # NOTE: We loop backwards.
+            for txn in txns:
+                if ending_nonce is not None and txn.nonce > ending_nonce:
+                    # NOTE: Skip all largest nonces first
+                    continue
 
-            elif txn.nonce < starting_nonce:
-                break  # NOTE: order is largest nonce to smallest, so safe to break here
+                elif txn.nonce < starting_nonce:
+                    break  # NOTE: order is largest nonce to smallest, so safe to break here
 
-            is_confirmed = len(txn.confirmations) >= txn.confirmations_required
+                if confirmed is not None:
+                    if not confirmed and txn._executed:
+                        break  # NOTE: Break at the first executed transaction
 
-            if confirmed is not None:
-                if not confirmed and isinstance(txn, ExecutedTxData):
-                    break  # NOTE: Break at the first executed transaction
+                    elif confirmed and len(txn.confirmations) < txn.confirmations_required:
+                        continue  # NOTE: Skip not confirmed transactions
 
-                elif confirmed and not is_confirmed:
-                    continue  # NOTE: Skip not confirmed transactions
+                if txn.nonce < next_nonce and not txn._executed:
+                    continue  # NOTE: Skip orphaned transactions
 
-            # NOTE: use `type(txn) is ...` because ExecutedTxData is a subclass of UnexecutedTxData
-            if txn.nonce < next_nonce and type(txn) is UnexecutedTxData:
-                continue  # NOTE: Skip orphaned transactions
+                if filter_by_ids and txn.safe_tx_hash not in filter_by_ids:
+                    continue  # NOTE: Skip transactions not in the filter
 
-            if filter_by_ids and txn.safe_tx_hash not in filter_by_ids:
-                continue  # NOTE: Skip transactions not in the filter
+                if missing_signers and missing_signers.issubset(
+                    {conf.owner for conf in txn.confirmations}
+                ):
+                    # NOTE: Skip if all signers from `filter_by_missing_signers`
+                    #       are in `txn.confirmations`
+                    continue
 
-            if filter_by_missing_signers and filter_by_missing_signers.issubset(
-                set(conf.owner for conf in txn.confirmations)
-            ):
-                # NOTE: Skip if all signers from `filter_by_missing_signers`
-                #       are in `txn.confirmations`
-                continue
+                yield txn
 
-            yield txn
+        finally:
+            # NOTE: Stop paginating right away when breaking early, instead of when collected.
+            #       Subclasses may return any iterator, which can't always be closed.
+            if close := getattr(txns, "close", None):
+                close()
 
     """Request methods"""
 
+    @classmethod
+    def close_sessions(cls):
+        """
+        Close the HTTP sessions shared by all clients, e.g. when tearing down tests.
+        """
+        while cls._sessions:
+            _, session = cls._sessions.popitem()
+            session.close()
+
     @cached_property
     def session(self) -> requests.Session:
+        if session := self._sessions.get(self.transaction_service_url):
+            return session
+
         session = requests.Session()
+        # NOTE: Per-request headers are merged with these by `requests`.
+        session.headers.update(DEFAULT_HEADERS)
         adapter = HTTPAdapter(
-            pool_connections=10,  # Doing all the connections to the same url
-            pool_maxsize=100,  # Number of concurrent connections
+            pool_connections=1,  # Doing all the connections to the same url
+            # NOTE: One connection per page fetched ahead of time, plus the caller's own.
+            pool_maxsize=PAGE_WINDOW + 1,
             pool_block=False,
         )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
+        self._sessions[self.transaction_service_url] = session
         return session
 
+    def _paginate(
+        self,
+        url: str,
+        parse: Callable[[bytes], Any] = from_json,
+    ) -> Iterator[dict]:
+        """
+        Iterate over the pages of a paginated endpoint. Once the caller moves past the first
+        page, following pages are requested while the current one is being consumed, hiding
+        the latency of each request.
+        Each raw page is turned into a dict by ``parse``, e.g. to validate it directly.
+        """
+        response = self._get(url)
+        data = parse(response.content)
+        # NOTE: Drop the raw body before yielding, so only the parsed page stays in memory.
+        del response
+
+        # NOTE: Most callers stop after the first page, so only request pages ahead of time
+        #       once the second one is asked for.
+        yield data
+
+        if not (next_url := data.get("next")):
+            return
+
+        elif (page_urls := _get_page_urls(next_url, data.get("count"))) is not None:
+            data = yield from self._paginate_concurrently(data, page_urls, parse)
+
+        # NOTE: Results may have been added since the count was read, so keep following `next`.
+        yield from self._paginate_sequentially(data, parse)
+
+    def _paginate_concurrently(
+        self, data: dict, page_urls: Iterator[str], parse: Callable[[bytes], Any]
+    ) -> Generator[dict, None, dict]:
+        # NOTE: The URLs of all pages are known, so request a window of them at a time.
+        executor = _get_executor()
+        pending = deque(executor.submit(self._get, u) for u in islice(page_urls, PAGE_WINDOW))
+        try:
+            while pending:
+                response = pending.popleft().result()
+                if (page_url := next(page_urls, None)) is not None:
+                    pending.append(executor.submit(self._get, page_url))
+
+                data = parse(response.content)
+                del response
+                yield data
+
+        finally:
+            # NOTE: Caller stopped iterating (or a request failed), so drop the rest.
+            for future in pending:
+                future.cancel()
+
+        return data
+
+    def _paginate_sequentially(self, data: dict, parse: Callable[[bytes], Any]) -> Iterator[dict]:
+        # NOTE: Only the `next` URL is known, so request one page ahead of time.
+        next_page: Optional["Future[Response]"] = None
+        try:
+            while next_url := data.get("next"):
+                response = next_page.result() if next_page is not None else self._get(next_url)
+                data = parse(response.content)
+                del response
+                if following_url := data.get("next"):
+                    next_page = _get_executor().submit(self._get, following_url)
+
+                else:
+                    next_page = None
+
+                yield data
+
+        finally:
+            # NOTE: Caller stopped iterating (or a request failed), so drop the next page.
+            if next_page is not None:
+                next_page.cancel()
+
     def _get(self, url: str) -> "Response":
         return self._request("GET", url)
 
     def _post(self, url: str, json: Optional[dict] = None, **kwargs) -> "Response":
         return self._request("POST", url, json=json, **kwargs)
 
-    @cached_property
-    def _http(self):
-        return urllib3.PoolManager(ca_certs=certifi.where())
-
     def _request(self, method: str, url: str, json: Optional[dict] = None, **kwargs) -> "Response":
         # NOTE: paged requests include full url already
-        if url.startswith(f"{self.transaction_service_url}/api/v1/"):
+        if url.startswith(self._api_url):
             api_url = url
         else:
             # **WARNING**: The trailing slash in the URL is CRITICAL!
             # If you remove it, things will not work as expected.
-            api_url = f"{self.transaction_service_url}/api/v1/{url}/"
+            api_url = f"{self._api_url}{url}/"
         do_fail = not kwargs.pop("allow_failure", False)
 
         # Use `or 10` to handle when None is explicit.
         kwargs["timeout"] = kwargs.get("timeout") or 10
 
-        # Add default headers
-        headers = kwargs.get("headers", {})
-        kwargs["headers"] = {**DEFAULT_HEADERS, **headers}
-        response = self.session.request(method, api_url, json=json, **kwargs)
+        if json is not None:
+            # NOTE: Encode the body ourselves, `pydantic_core` is faster than stdlib `json`.
+            kwargs["data"] = to_json(json)
+
+        response = self.session.request(method, api_url, **kwargs)
 
         if not response.ok and do_fail:
             raise ClientResponseError(api_url, response)
@@ -1,10 +1,9 @@
 from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional, Union, cast
+from typing import TYPE_CHECKING, Optional, Union
 
+from ape.types import HexBytes
 from ape.utils import ZERO_ADDRESS, ManagerAccessMixin
-from eth_utils import keccak, to_hex
-from hexbytes import HexBytes
 
 from ape_safe.client.base import BaseSafeClient
 from ape_safe.client.types import (
@@ -16,7 +15,7 @@ from ape_safe.client.types import (
     SignatureType,
     UnexecutedTxData,
 )
-from ape_safe.utils import get_safe_tx_hash
+from ape_safe.utils import FALLBACK_HANDLER_STORAGE_SLOT, get_safe_tx_hash, to_safe_tx_id
 
 if TYPE_CHECKING:
     from ape.contracts import ContractInstance
@@ -28,11 +27,13 @@ class MockSafeClient(BaseSafeClient, ManagerAccessMixin):
         self.contract = contract
         self.transactions: dict[SafeTxID, SafeApiTxData] = {}
         self.transactions_by_nonce: dict[int, list[SafeTxID]] = {}
+        # NOTE: The ABI never changes, so only check for these methods once.
+        self._has_get_guard = "getGuard" in contract._view_methods_
+        self._has_get_modules = "getModules" in contract._view_methods_
 
     @property
     def safe_details(self) -> SafeDetails:
-        slot = keccak(text="fallback_manager.handler.address")
-        value = self.provider.get_storage(self.contract.address, slot)
+        value = self.provider.get_storage(self.contract.address, FALLBACK_HANDLER_STORAGE_SLOT)
         fallback_address = self.network_manager.ecosystem.decode_address(value[-20:])
 
         return SafeDetails(
@@ -50,13 +51,11 @@ class MockSafeClient(BaseSafeClient, ManagerAccessMixin):
 
     @property
     def guard(self) -> "AddressType":
-        return (
-            self.contract.getGuard() if "getGuard" in self.contract._view_methods_ else ZERO_ADDRESS
-        )
+        return self.contract.getGuard() if self._has_get_guard else ZERO_ADDRESS
 
     @property
     def modules(self) -> list["AddressType"]:
-        return self.contract.getModules() if "getModules" in self.contract._view_methods_ else []
+        return self.contract.getModules() if self._has_get_modules else []
 
     def get_next_nonce(self) -> int:
         return self.contract._view_methods_["nonce"]()
@@ -70,50 +69,51 @@ class MockSafeClient(BaseSafeClient, ManagerAccessMixin):
                     yield tx
 
     def get_confirmations(self, safe_tx_hash: SafeTxID) -> Iterator[SafeTxConfirmation]:
-        tx_hash = cast(SafeTxID, to_hex(HexBytes(safe_tx_hash)))
-        if safe_tx_data := self.transactions.get(tx_hash):
+        if safe_tx_data := self.transactions.get(to_safe_tx_id(safe_tx_hash)):
             yield from safe_tx_data.confirmations
 
     def post_transaction(
         self, safe_tx: SafeTx, signatures: dict["AddressType", "MessageSignature"], **kwargs
     ):
-        safe_tx_data = UnexecutedTxData.from_safe_tx(safe_tx, self.safe_details.threshold)
-        safe_tx_data.confirmations.extend(
-            SafeTxConfirmation(
+        # NOTE: Only the threshold is needed, so skip the other Safe details calls.
+        safe_tx_data = UnexecutedTxData.from_safe_tx(safe_tx, self.contract.getThreshold())
+        now = datetime.now(timezone.utc)
+        # NOTE: Signers and signatures are already valid, so skip validating the confirmations.
+        safe_tx_data.confirmations += [
+            SafeTxConfirmation.model_construct(
                 owner=signer,
-                submissionDate=datetime.now(timezone.utc),
-                signature=sig.encode_rsv(),
-                signatureType=SignatureType.EOA,
+                submission_date=now,
+                signature=HexBytes(sig.encode_rsv()),
+                signature_type=SignatureType.EOA,
             )
             for signer, sig in signatures.items()
-        )
-        tx_id = cast(SafeTxID, to_hex(HexBytes(safe_tx_data.safe_tx_hash)))
+        ]
+        # NOTE: Computed by `get_safe_tx_hash`, so already normalized.
+        tx_id = safe_tx_data.safe_tx_hash
         self.transactions[tx_id] = safe_tx_data
-        if safe_tx_data.nonce in self.transactions_by_nonce:
-            self.transactions_by_nonce[safe_tx_data.nonce].append(tx_id)
-        else:
-            self.transactions_by_nonce[safe_tx_data.nonce] = [tx_id]
+        self.transactions_by_nonce.setdefault(safe_tx_data.nonce, []).append(tx_id)
 
     def post_signatures(
         self,
         safe_tx_or_hash: Union[SafeTx, SafeTxID],
         signatures: dict["AddressType", "MessageSignature"],
     ):
-        for signer, signature in signatures.items():
-            safe_tx_id = (
-                safe_tx_or_hash
-                if isinstance(safe_tx_or_hash, (str, bytes, int))
-                else get_safe_tx_hash(safe_tx_or_hash)
-            )
-            tx_id = cast(SafeTxID, to_hex(HexBytes(safe_tx_id)))
-            self.transactions[tx_id].confirmations.append(
-                SafeTxConfirmation(
-                    owner=signer,
-                    submissionDate=datetime.now(timezone.utc),
-                    signature=signature.encode_rsv(),
-                    signatureType=SignatureType.EOA,
-                )
+        safe_tx_id = (
+            safe_tx_or_hash
+            if isinstance(safe_tx_or_hash, (str, bytes, int))
+            else get_safe_tx_hash(safe_tx_or_hash)
+        )
+        tx_id = to_safe_tx_id(safe_tx_id)
+        now = datetime.now(timezone.utc)
+        self.transactions[tx_id].confirmations += [
+            SafeTxConfirmation.model_construct(
+                owner=signer,
+                submission_date=now,
+                signature=HexBytes(signature.encode_rsv()),
+                signature_type=SignatureType.EOA,
             )
+            for signer, signature in signatures.items()
+        ]
 
     def estimate_gas_cost(
         self, receiver: "AddressType", value: int, data: bytes, operation: int = 0
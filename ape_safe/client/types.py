@@ -1,12 +1,11 @@
 from datetime import datetime, timezone
 from enum import Enum
-from typing import NewType, Optional, Union, cast
+from typing import ClassVar, NewType, Optional, Union, cast
 
 from ape.types import AddressType, HexBytes
 from eip712.common import SafeTxV1, SafeTxV2
-from eth_typing import HexStr
-from eth_utils import add_0x_prefix, to_hex
-from pydantic import BaseModel, Field
+from eth_utils import to_checksum_address
+from pydantic import BaseModel, ConfigDict, Field
 
 from ape_safe.utils import get_safe_tx_hash
 
@@ -15,6 +14,9 @@ SafeTxID = NewType("SafeTxID", str)
 
 
 class SafeDetails(BaseModel):
+    # NOTE: Instances are cached and shared by the client, so they must not be changed.
+    model_config = ConfigDict(frozen=True)
+
     address: AddressType
     nonce: int
     threshold: int
@@ -33,6 +35,8 @@ class SignatureType(str, Enum):
 
 
 class SafeTxConfirmation(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     owner: AddressType
     submission_date: datetime = Field(alias="submissionDate")
     transaction_hash: Optional[HexBytes] = Field(default=None, alias="transactionHash")
@@ -65,15 +69,31 @@ class UnexecutedTxData(BaseModel):
     trusted: bool = True
     signatures: Optional[HexBytes] = None
 
+    # NOTE: Tells executed transactions apart without `isinstance` (which includes subclasses).
+    _executed: ClassVar[bool] = False
+
     @classmethod
     def from_safe_tx(cls, safe_tx: SafeTx, confirmations_required: int) -> "UnexecutedTxData":
-        return cls(
-            safe=safe_tx._verifyingContract_,
-            submissionDate=datetime.now(timezone.utc),
-            modified=datetime.now(timezone.utc),
-            confirmationsRequired=confirmations_required,
-            safeTxHash=get_safe_tx_hash(safe_tx),
-            **safe_tx._body_["message"],
+        message = safe_tx._body_["message"]
+        now = datetime.now(timezone.utc)
+        # NOTE: The message fields are already typed by EIP-712, so skip validating them.
+        #       Only addresses are normalized, as they may not be checksummed.
+        return cls.model_construct(
+            safe=to_checksum_address(cast(str, safe_tx._verifyingContract_)),
+            to=to_checksum_address(message["to"]),
+            value=message["value"],
+            data=HexBytes(message["data"]),
+            operation=OperationType(message["operation"]),
+            gas_token=to_checksum_address(message["gasToken"]),
+            safe_tx_gas=message["safeTxGas"],
+            base_gas=message["baseGas"],
+            gas_price=message["gasPrice"],
+            refund_receiver=to_checksum_address(message["refundReceiver"]),
+            nonce=message["nonce"],
+            submission_date=now,
+            modified=now,
+            safe_tx_hash=get_safe_tx_hash(safe_tx),
+            confirmations_required=confirmations_required,
         )
 
     @property
@@ -93,9 +113,12 @@ class UnexecutedTxData(BaseModel):
 
     def __str__(self) -> str:
         # TODO: Decode data
-        data_hex = to_hex(self.data) if self.data else ""
-        if len(data_hex) > 40:
-            data_hex = f"{data_hex[:18]}....{data_hex[-18:]}"
+        data = self.data or b""
+        if len(data) > 19:
+            # NOTE: Only encode the bytes that are shown, calldata can be very large.
+            data_hex = f"0x{bytes.hex(data[:8])}....{bytes.hex(data[-9:])}"
+        else:
+            data_hex = f"0x{bytes.hex(data)}"
 
         # TODO: Handle MultiSend contract differently
         return f"""Tx ID {self.nonce}
@@ -103,7 +126,7 @@ class UnexecutedTxData(BaseModel):
    from: {self.safe}
      to: {self.to}
   value: {self.value / 1e18} ether
-   data: {add_0x_prefix(cast(HexStr, data_hex))}
+   data: {data_hex}
 """
 
 
@@ -122,5 +145,7 @@ class ExecutedTxData(UnexecutedTxData):
     origin: str
     data_decoded: Optional[dict] = Field(alias="dataDecoded")
 
+    _executed: ClassVar[bool] = True
+
 
 SafeApiTxData = Union[ExecutedTxData, UnexecutedTxData]
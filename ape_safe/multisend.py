@@ -1,11 +1,11 @@
+from functools import cache
 from importlib.resources import files
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional
 
 from ape import convert
 from ape.types import AddressType, HexBytes
 from ape.utils import ManagerAccessMixin, cached_property
-from eth_abi.packed import encode_packed
 from ethpm_types import PackageManifest
 
 from ape_safe.exceptions import UnsupportedChainError, ValueRequired
@@ -13,15 +13,46 @@ from ape_safe.exceptions import UnsupportedChainError, ValueRequired
 if TYPE_CHECKING:
     from ape.api import ReceiptAPI, TransactionAPI
     from ape.contracts.base import ContractInstance, ContractTransactionHandler
+    from ethpm_types import ContractType
 
 MULTISEND_CALL_ONLY_ADDRESSES = (
     "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",  # MultiSend Call Only v1.3.0
     "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",  # MultiSend Call Only v1.3.0 (EIP-155)
 )
-MULTISEND_CALL_ONLY_MANIFEST = PackageManifest.model_validate_json(
-    files("ape_safe").joinpath("manifests/multisend.json").read_text()
-)
-MULTISEND_CALL_ONLY = MULTISEND_CALL_ONLY_MANIFEST.contract_types["MultiSendCallOnly"]  # type: ignore # noqa: E501
+
+
+# NOTE: The manifest is loaded on first use, to keep importing the plugin fast.
+@cache
+def _get_multisend_call_only_manifest() -> PackageManifest:
+    return PackageManifest.model_validate_json(
+        files("ape_safe").joinpath("manifests/multisend.json").read_text()
+    )
+
+
+@cache
+def _get_multisend_call_only() -> "ContractType":
+    return _get_multisend_call_only_manifest().contract_types["MultiSendCallOnly"]  # type: ignore
+
+
+@cache
+def _get_multisend_runtime_bytecode() -> Optional[HexBytes]:
+    # NOTE: Decoded once, instead of for every address checked.
+    return _get_multisend_call_only().get_runtime_bytecode()
+
+
+def _encode_call(call: dict) -> bytes:
+    # NOTE: The packed layout never changes, so build it directly instead of using
+    #       `encode_packed(["uint8", "address", "uint256", "uint256", "bytes"], ...)`.
+    call_data = call["callData"]
+    return b"".join(
+        (
+            call["operation"].to_bytes(1, "big"),
+            bytes.fromhex(call["target"][2:]),
+            call["value"].to_bytes(32, "big"),
+            len(call_data).to_bytes(32, "big"),
+            call_data,
+        )
+    )
 
 
 class MultiSend(ManagerAccessMixin):
@@ -79,15 +110,16 @@ class MultiSend(ManagerAccessMixin):
         assert active_provider, "Must be connected to an active network to deploy"
 
         active_provider.set_code(
-            MULTISEND_CALL_ONLY_ADDRESSES[0], MULTISEND_CALL_ONLY.get_runtime_bytecode()
+            MULTISEND_CALL_ONLY_ADDRESSES[0], _get_multisend_runtime_bytecode()
         )
 
     @cached_property
     def contract(self) -> "ContractInstance":
+        runtime_bytecode = _get_multisend_runtime_bytecode()
         for address in MULTISEND_CALL_ONLY_ADDRESSES:
-            if self.provider.get_code(address) == MULTISEND_CALL_ONLY.get_runtime_bytecode():
+            if self.provider.get_code(address) == runtime_bytecode:
                 return self.chain_manager.contracts.instance_at(
-                    address, contract_type=MULTISEND_CALL_ONLY
+                    address, contract_type=_get_multisend_call_only()
                 )
 
         raise UnsupportedChainError()
@@ -138,19 +170,7 @@ class MultiSend(ManagerAccessMixin):
 
     @property
     def encoded_calls(self):
-        return [
-            encode_packed(
-                ["uint8", "address", "uint256", "uint256", "bytes"],
-                [
-                    call["operation"],
-                    call["target"],
-                    call["value"],
-                    len(call["callData"]),
-                    call["callData"],
-                ],
-            )
-            for call in self.calls
-        ]
+        return [_encode_call(call) for call in self.calls]
 
     def __call__(self, **txn_kwargs) -> "ReceiptAPI":
         """
@@ -213,3 +233,14 @@ class MultiSend(ManagerAccessMixin):
                     "callData": data,
                 }
             )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "MULTISEND_CALL_ONLY_MANIFEST":
+        return _get_multisend_call_only_manifest()
+
+    elif name == "MULTISEND_CALL_ONLY":
+        return _get_multisend_call_only()
+
+    else:
+        raise AttributeError(name)
@@ -1,22 +1,58 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Union, cast
 
+from ape.types import HexBytes
 from eip712.messages import calculate_hash
-from eth_utils import to_hex, to_int
+from eth_utils import keccak
 
 if TYPE_CHECKING:
     from ape.types import AddressType, MessageSignature
 
     from ape_safe.client.types import SafeTxID
 
+# NOTE: Storage slot of the Safe's fallback handler address, see `FallbackManager.sol`.
+FALLBACK_HANDLER_STORAGE_SLOT = keccak(text="fallback_manager.handler.address")
+
+# NOTE: `SafeTx` instances are not hashable, so hashes are cached by EIP-712 domain and message.
+_SAFE_TX_HASH_CACHE: dict[tuple, "SafeTxID"] = {}
+_SAFE_TX_HASH_CACHE_SIZE = 256
+
 
 def order_by_signer(
     signatures: Mapping["AddressType", "MessageSignature"]
 ) -> list["MessageSignature"]:
-    # NOTE: Must order signatures in ascending order of signer address (converted to int)
-    return list(signatures[signer] for signer in sorted(signatures, key=lambda a: to_int(hexstr=a)))
+    # NOTE: Must order signatures in ascending order of signer address (converted to int).
+    #       Addresses all have the same length, so they sort like their integer values
+    #       once lowercased, without parsing them.
+    return [signatures[signer] for signer in sorted(signatures, key=str.lower)]
+
+
+def to_safe_tx_id(safe_tx_hash: Union[str, bytes, int]) -> "SafeTxID":
+    if (
+        isinstance(safe_tx_hash, str)
+        and len(safe_tx_hash) == 66
+        and safe_tx_hash.startswith("0x")
+        and safe_tx_hash == safe_tx_hash.lower()
+    ):
+        return cast("SafeTxID", safe_tx_hash)  # NOTE: Already normalized, skip converting.
+
+    elif isinstance(safe_tx_hash, bytes):
+        return cast("SafeTxID", f"0x{bytes.hex(safe_tx_hash)}")  # NOTE: Skip copying the bytes.
+
+    return cast("SafeTxID", f"0x{bytes.hex(HexBytes(safe_tx_hash))}")
 
 
 def get_safe_tx_hash(safe_tx) -> "SafeTxID":
+    body = safe_tx._body_
+    key = (tuple(body["domain"].items()), tuple(body["message"].items()))
+    if (safe_tx_hash := _SAFE_TX_HASH_CACHE.get(key)) is not None:
+        return safe_tx_hash
+
     message_hash = calculate_hash(safe_tx.signable_message)
-    return cast("SafeTxID", to_hex(message_hash))
+    safe_tx_hash = cast("SafeTxID", f"0x{bytes.hex(message_hash)}")
+    if len(_SAFE_TX_HASH_CACHE) >= _SAFE_TX_HASH_CACHE_SIZE:
+        # NOTE: Dicts keep insertion order, so this evicts the oldest hash.
+        _SAFE_TX_HASH_CACHE.pop(next(iter(_SAFE_TX_HASH_CACHE)), None)
+
+    _SAFE_TX_HASH_CACHE[key] = safe_tx_hash
+    return safe_tx_hash
@@ -0,0 +1,210 @@
+import threading
+import time
+
+import pytest
+from ape.types import MessageSignature
+from eip712.common import create_safe_tx_def
+from eth_utils import to_hex
+from pydantic_core import from_json, to_json
+
+from ape_safe.client import SAFE_DETAILS_CACHE_TTL, SafeClient, get_origin
+from ape_safe.client.base import _get_page_urls
+
+SAFE_ADDRESS = "0x1111111111111111111111111111111111111111"
+OWNER_ADDRESS = "0x2222222222222222222222222222222222222222"
+SAFE_DETAILS = {
+    "address": SAFE_ADDRESS,
+    "nonce": 3,
+    "threshold": 1,
+    "owners": [OWNER_ADDRESS],
+    "masterCopy": OWNER_ADDRESS,
+    "modules": [],
+    "fallbackHandler": OWNER_ADDRESS,
+    "guard": OWNER_ADDRESS,
+    "version": "1.3.0",
+}
+NUM_PAGES = 7
+
+
+class _Response:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def json(self):
+        return from_json(self.content)
+
+
+@pytest.fixture
+def requested():
+    return []
+
+
+@pytest.fixture(params=("offset", "cursor"))
+def paged_client(request, monkeypatch, requested):
+    client = SafeClient(SAFE_ADDRESS, override_url="https://safe.example")
+    page_url = f"{client._api_url}pages/"
+    lock = threading.Lock()
+
+    def next_url(page: int):
+        if page >= NUM_PAGES:
+            return None
+
+        elif request.param == "offset":
+            return f"{page_url}?limit=1&offset={page}"
+
+        return f"{page_url}?cursor={page}"
+
+    def get(url: str):
+        with lock:
+            requested.append(url)
+
+        page = int(url.rsplit("=", 1)[1]) if "=" in url else 0
+        # NOTE: Later pages respond faster, so out-of-order delivery would show.
+        time.sleep(0.01 * (NUM_PAGES - page))
+        data = {"count": NUM_PAGES, "next": next_url(page + 1), "results": [page]}
+        return _Response(to_json(data))
+
+    monkeypatch.setattr(client, "_get", get)
+    return client
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("ape_safe.client.time.monotonic", lambda: clock[0])
+    return clock
+
+
+@pytest.fixture
+def details_client(monkeypatch, requested):
+    client = SafeClient(SAFE_ADDRESS, override_url="https://safe.example")
+
+    def get(url: str):
+        requested.append(url)
+        return _Response(to_json(SAFE_DETAILS))
+
+    monkeypatch.setattr(client, "_get", get)
+    return client
+
+
+def test_safe_details_cached(details_client, requested, now):
+    assert details_client.safe_details.nonce == SAFE_DETAILS["nonce"]
+    now[0] += SAFE_DETAILS_CACHE_TTL - 1
+    assert details_client.safe_details.nonce == SAFE_DETAILS["nonce"]
+    assert len(requested) == 1
+
+
+def test_safe_details_cache_expires(details_client, requested, now):
+    _ = details_client.safe_details
+    now[0] += SAFE_DETAILS_CACHE_TTL
+    _ = details_client.safe_details
+    assert len(requested) == 2
+
+
+def test_invalidate_safe_details(details_client, requested, now):
+    _ = details_client.safe_details
+    details_client.invalidate_safe_details()
+    _ = details_client.safe_details
+    assert len(requested) == 2
+
+
+def test_get_next_nonce_not_cached(details_client, requested, now):
+    _ = details_client.safe_details
+    assert details_client.get_next_nonce() == SAFE_DETAILS["nonce"]
+    assert len(requested) == 2
+
+
+def test_post_transaction(details_client, monkeypatch):
+    posted = []
+    monkeypatch.setattr(details_client, "_post", lambda url, json: posted.append((url, json)))
+    SafeTx = create_safe_tx_def(version="1.3.0", contract_address=SAFE_ADDRESS, chain_id=1)
+    safe_tx = SafeTx(to=OWNER_ADDRESS, value=1, data=b"\x12\x34", nonce=3)
+    signature = MessageSignature(v=27, r=b"\x01" * 32, s=b"\x02" * 32)
+
+    details_client.post_transaction(
+        safe_tx,
+        {OWNER_ADDRESS: signature},
+        contractTransactionHash="0x1234",
+        sender=OWNER_ADDRESS,
+    )
+
+    assert posted == [
+        (
+            f"safes/{SAFE_ADDRESS}/multisig-transactions",
+            {
+                "signature": to_hex(signature.encode_rsv()),
+                "origin": get_origin(),
+                "safe": SAFE_ADDRESS,
+                "to": OWNER_ADDRESS,
+                "value": 1,
+                "data": "0x1234",
+                "operation": 0,
+                "gasToken": "0x0000000000000000000000000000000000000000",
+                "safeTxGas": 0,
+                "baseGas": 0,
+                "gasPrice": 0,
+                "refundReceiver": "0x0000000000000000000000000000000000000000",
+                "nonce": 3,
+                "contractTransactionHash": "0x1234",
+                "sender": OWNER_ADDRESS,
+            },
+        )
+    ]
+
+
+def test_get_page_urls():
+    page_urls = _get_page_urls("https://safe.example/api/v1/pages/?limit=2&offset=2", 7)
+    assert page_urls is not None
+    assert list(page_urls) == [
+        "https://safe.example/api/v1/pages/?limit=2&offset=2",
+        "https://safe.example/api/v1/pages/?limit=2&offset=4",
+        "https://safe.example/api/v1/pages/?limit=2&offset=6",
+    ]
+
+
+@pytest.mark.parametrize(
+    "next_url,count",
+    [
+        # Cursor pagination, the following URLs are not known in advance.
+        ("https://safe.example/api/v1/pages/?cursor=abc", 7),
+        # Unknown number of results.
+        ("https://safe.example/api/v1/pages/?limit=2&offset=2", None),
+        # Invalid page size.
+        ("https://safe.example/api/v1/pages/?limit=0&offset=2", 7),
+        ("https://safe.example/api/v1/pages/?limit=a&offset=2", 7),
+    ],
+)
+def test_get_page_urls_unknown(next_url, count):
+    assert _get_page_urls(next_url, count) is None
+
+
+def test_paginate(paged_client, requested):
+    pages = [data["results"] for data in paged_client._paginate("pages")]
+    assert pages == [[page] for page in range(NUM_PAGES)]
+    assert len(requested) == NUM_PAGES
+
+
+def test_paginate_close_after_first_page(paged_client, requested):
+    pages = paged_client._paginate("pages")
+    assert next(pages)["results"] == [0]
+    pages.close()
+
+    # NOTE: Nothing is requested ahead of time until the second page is asked for.
+    time.sleep(0.1)
+    assert requested == ["pages"]
+
+
+def test_paginate_count_grows(monkeypatch):
+    client = SafeClient(SAFE_ADDRESS, override_url="https://safe.example")
+    page_url = f"{client._api_url}pages/"
+
+    def get(url: str):
+        page = int(url.rsplit("=", 1)[1]) if "=" in url else 0
+        # NOTE: Results are added while paginating, so the count grows with every page.
+        count = 3 + page
+        next_url = f"{page_url}?limit=1&offset={page + 1}" if page + 1 < NUM_PAGES else None
+        return _Response(to_json({"count": count, "next": next_url, "results": [page]}))
+
+    monkeypatch.setattr(client, "_get", get)
+    pages = [data["results"] for data in client._paginate("pages")]
+    assert pages == [[page] for page in range(NUM_PAGES)]
@@ -1,3 +1,10 @@
+import pytest
+from ape.types import HexBytes
+from eth_abi.packed import encode_packed
+
+from ape_safe.multisend import _encode_call
+
+
 def test_asset(vault, token):
     assert vault.asset() == token
 
@@ -16,3 +23,42 @@ def test_decode_multisend(multisend):
     )
     multisend.add_from_calldata(calldata)
     assert multisend.handler.encode_input(b"".join(multisend.encoded_calls)) == calldata
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        {
+            "operation": 0,
+            "target": "0x527e80008D212E2891C737Ba8a2768a7337D7Fd2",
+            "value": 0,
+            "callData": HexBytes(
+                "0xf0080878000000000000000000000000584bffc5f51ccae39ad69f1c399743620e619c2b"
+            ),
+        },
+        {
+            "operation": 1,
+            "target": "0x0000000000000000000000000000000000000001",
+            "value": 10**18,
+            "callData": HexBytes(b""),
+        },
+        {
+            "operation": 0,
+            "target": "0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF",
+            "value": 2**256 - 1,
+            "callData": HexBytes(b"\x01" * 100),
+        },
+    ],
+)
+def test_encode_call(call):
+    expected = encode_packed(
+        ["uint8", "address", "uint256", "uint256", "bytes"],
+        [
+            call["operation"],
+            call["target"],
+            call["value"],
+            len(call["callData"]),
+            call["callData"],
+        ],
+    )
+    assert _encode_call(call) == expected
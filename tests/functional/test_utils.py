@@ -1,4 +1,7 @@
-from ape_safe.utils import order_by_signer
+from eip712.messages import calculate_hash
+from eth_utils import to_hex
+
+from ape_safe.utils import get_safe_tx_hash, order_by_signer, to_safe_tx_id
 
 
 def test_order_by_signer_empty():
@@ -30,3 +33,20 @@ def test_order_by_signer_n_sigs(accounts):
     act_0 = order_by_signer(signature_map_0)
     act_1 = order_by_signer(signature_map_1)
     assert act_0 == act_1 == expected
+
+
+def test_get_safe_tx_hash(safe):
+    safe_tx = safe.create_safe_tx(to=safe.address, nonce=0)
+    expected = to_hex(calculate_hash(safe_tx.signable_message))
+    assert get_safe_tx_hash(safe_tx) == expected
+
+    # Equal transactions share the (cached) hash, different ones do not.
+    assert get_safe_tx_hash(safe.create_safe_tx(to=safe.address, nonce=0)) == expected
+    assert get_safe_tx_hash(safe.create_safe_tx(to=safe.address, nonce=1)) != expected
+
+
+def test_to_safe_tx_id():
+    safe_tx_hash = f"0x{'ab' * 32}"
+    assert to_safe_tx_id(safe_tx_hash) == safe_tx_hash
+    assert to_safe_tx_id(safe_tx_hash.upper().replace("0X", "0x")) == safe_tx_hash
+    assert to_safe_tx_id(bytes.fromhex("ab" * 32)) == safe_tx_hash